@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 
-import re
 import sys
+import copy
+import collections
+import functools
 import argparse
-import math
+import threading
 from io import StringIO
 
 import docutils.frontend
+import docutils.io
 import docutils.nodes
 import docutils.parsers.rst
 import docutils.transforms.references
@@ -17,11 +20,56 @@ import docutils.writers
 # XXX Hack: monkeypatch docutils to support gemini:// URIs
 import docutils.utils.urischemes
 
-if "gemini" not in docutils.utils.urischemes.schemes:
-    docutils.utils.urischemes.schemes["gemini"] = ""
+docutils.utils.urischemes.schemes.setdefault("gemini", "")
 # XXX
 
 
+#: Default docutils settings for the reStructuredText parser (lazily built by
+#: :func:`_get_default_settings`)
+_DEFAULT_SETTINGS = None
+_DEFAULT_SETTINGS_LOCK = threading.Lock()
+
+#: Per-thread storage of the reStructuredText parser (see :func:`_get_rst_parser`)
+_RST_PARSER_LOCAL = threading.local()
+
+#: Gemtext already generated by :func:`convert`, by (rst_text, source_path)
+#: (least recently used first)
+_CONVERT_CACHE = collections.OrderedDict()
+_CONVERT_CACHE_MAX_SIZE = 256
+
+#: Letters used to number alphabetical lists
+_LOWERALPHA_GLYPHS = "abcdefghijklmnopqrstuvwxyz"
+
+#: Line used to render transitions and to frame admonitions
+_SEPARATOR_LINE = "-" * 80
+
+#: Prefixes of the titles, indexed by level - 1 (Gemtext has only 3 levels)
+_TITLE_PREFIXES = ("# ", "## ", "### ")
+
+#: Translation table replacing CR characters by LF characters
+_CR_TO_LF_TABLE = str.maketrans("\r", "\n")
+
+#: Translation table replacing CR and LF characters by spaces
+_NEWLINES_TO_SPACES_TABLE = str.maketrans("\r\n", "  ")
+
+#: Characters that can start inline markup, references or special constructs:
+#: :func:`fast_convert` leaves the lines containing them to docutils
+_FAST_CONVERT_SPECIAL_CHARS = frozenset("*`_|[]\\<>:@")
+
+#: Characters that start a line that could be a list, an option list or a
+#: directive: :func:`fast_convert` leaves these lines to docutils
+_FAST_CONVERT_SPECIAL_LINE_STARTS = frozenset("-+/.(#\u2022\u2023\u2043")
+
+#: Characters that can be used to underline section titles
+_SECTION_ADORNMENT_CHARS = frozenset("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~")
+
+#: Characters of roman numerals (that can number enumerated lists)
+_ROMAN_NUMERAL_CHARS = frozenset("ivxlcdmIVXLCDM")
+
+#: Bullets of the lists handled by :func:`fast_convert`
+_FAST_CONVERT_BULLETS = ("* ", "- ", "+ ")
+
+
 def convert_to_unix_end_of_line(text):
     """Replace Windows and old macOS end of line by Unix end of lines.
 
@@ -41,7 +89,7 @@ def convert_to_unix_end_of_line(text):
     >>> convert_to_unix_end_of_line("Windows\\r\\nmacOS 9\\rand Unix\\n\\nEOL")
     'Windows\\nmacOS 9\\nand Unix\\n\\nEOL'
     """
-    return text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.replace("\r\n", "\n").translate(_CR_TO_LF_TABLE)
 
 
 def remove_newlines(text):
@@ -59,8 +107,13 @@ def remove_newlines(text):
 
     >>> remove_newlines("Windows\\r\\nmacOS 9\\rand Unix\\n\\nEOL")
     'Windows macOS 9 and Unix  EOL'
+
+    >>> remove_newlines("No EOL")
+    'No EOL'
     """
-    return convert_to_unix_end_of_line(text).replace("\n", " ")
+    if "\n" not in text and "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").translate(_NEWLINES_TO_SPACES_TABLE)
 
 
 def flatten_node_tree(nodes):
@@ -72,9 +125,11 @@ def flatten_node_tree(nodes):
     :rtype: list<Node>
     """
     result_nodes = []
-    for node in nodes:
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
         if isinstance(node, NodeGroup):
-            result_nodes += flatten_node_tree(node.nodes)
+            stack.extend(reversed(node.nodes))
         else:
             result_nodes.append(node)
     return result_nodes
@@ -89,11 +144,13 @@ def search_lines_recursive(rst_node):
     :returns: A flat list of Nodes with the ``Node.line`` attribute defined.
     """
     lines = []
-    if rst_node.line:
-        lines.append(rst_node)
-    if rst_node.children:
-        for child_rst_node in rst_node.children:
-            lines += search_lines_recursive(child_rst_node)
+    stack = [rst_node]
+    while stack:
+        rst_node = stack.pop()
+        if rst_node.line:
+            lines.append(rst_node)
+        if rst_node.children:
+            stack.extend(reversed(rst_node.children))
     return lines
 
 
@@ -119,10 +176,99 @@ def get_node_end_line(rst_node):
     >>> get_node_end_line(node)
     43
     """
-    node_start_line = rst_node.line
-    node_height = len(convert_to_unix_end_of_line(rst_node.astext()).split("\n"))
-    node_end_line = node_start_line + node_height - 1
-    return node_end_line
+    text = rst_node.astext()
+    # CR LF, LF and CR end of lines all count for one line break
+    line_breaks = text.count("\n") + text.count("\r") - text.count("\r\n")
+    return rst_node.line + line_breaks
+
+
+@functools.lru_cache(maxsize=1024)
+def _number_to_loweralpha(number):
+    """Converts a list item number to lowercase letters (a, b,..., z, aa,...).
+
+    :param int number: The number to convert (starting from 1).
+
+    :rtype: str
+
+    >>> _number_to_loweralpha(28)
+    'ab'
+    """
+    if 1 <= number <= len(_LOWERALPHA_GLYPHS):
+        return _LOWERALPHA_GLYPHS[number - 1]
+    result = []
+    while number:
+        number, index = divmod(number - 1, len(_LOWERALPHA_GLYPHS))
+        result.append(_LOWERALPHA_GLYPHS[index])
+    return "".join(reversed(result))
+
+
+@functools.lru_cache(maxsize=1024)
+def _number_to_upperalpha(number):
+    """Converts a list item number to uppercase letters (A, B,..., Z, AA,...).
+
+    :param int number: The number to convert (starting from 1).
+
+    :rtype: str
+    """
+    return _number_to_loweralpha(number).upper()
+
+
+@functools.lru_cache(maxsize=1024)
+def _number_to_upperroman(number):
+    """Converts a list item number to uppercase roman numerals.
+
+    :param int number: The number to convert.
+
+    :rtype: str
+    """
+    return docutils.utils.roman.toRoman(number)
+
+
+@functools.lru_cache(maxsize=1024)
+def _number_to_lowerroman(number):
+    """Converts a list item number to lowercase roman numerals.
+
+    :param int number: The number to convert.
+
+    :rtype: str
+    """
+    return _number_to_upperroman(number).lower()
+
+
+def _get_default_settings():
+    """Returns the default docutils settings for the reStructuredText parser.
+
+    The settings are only computed once as building them requires to parse
+    the option specs of every docutils component and to read the
+    configuration files. The returned object is shared: copy it before using
+    it for a document.
+
+    :rtype: docutils.frontend.Values
+    """
+    global _DEFAULT_SETTINGS
+    if _DEFAULT_SETTINGS is None:
+        with _DEFAULT_SETTINGS_LOCK:
+            if _DEFAULT_SETTINGS is None:
+                _DEFAULT_SETTINGS = docutils.frontend.get_default_settings(
+                    docutils.parsers.rst.Parser
+                )
+    return _DEFAULT_SETTINGS
+
+
+def _get_rst_parser():
+    """Returns the reStructuredText parser of the current thread.
+
+    The parser is reused across documents to avoid rebuilding it for each
+    conversion. The parsing state being stored on the parser instance, a
+    parser is created per thread.
+
+    :rtype: docutils.parsers.rst.Parser
+    """
+    parser = getattr(_RST_PARSER_LOCAL, "parser", None)
+    if parser is None:
+        parser = docutils.parsers.rst.Parser()
+        _RST_PARSER_LOCAL.parser = parser
+    return parser
 
 
 def parse_rst(rst_text, source_path="document"):
@@ -134,8 +280,10 @@ def parse_rst(rst_text, source_path="document"):
                             ``include`` directive)
     :rtype: docutils.nodes.document
     """
-    parser = docutils.parsers.rst.Parser()
-    settings = docutils.frontend.get_default_settings(docutils.parsers.rst.Parser)
+    parser = _get_rst_parser()
+    # The parser mutates some settings (tab_width, record_dependencies,...)
+    settings = copy.copy(_get_default_settings())
+    settings.record_dependencies = docutils.utils.DependencyList()
     document = docutils.utils.new_document(source_path, settings=settings)
     document._original_rst = rst_text
     parser.parse(rst_text, document)
@@ -145,27 +293,50 @@ def parse_rst(rst_text, source_path="document"):
 class Node:
     """Base class to implement Gemini text nodes."""
 
+    __slots__ = ("rst_node", "_chunks")
+
     def __init__(self, rst_node):
         #: The original reStructuredText node
         self.rst_node = rst_node
-        #: Contains raw text extracted from reStructuredText nodes.
-        self.rawtext = ""
+        #: Fragments of the raw text extracted from reStructuredText nodes.
+        self._chunks = []
+
+    @property
+    def rawtext(self):
+        """Contains raw text extracted from reStructuredText nodes."""
+        # Collapse the chunks so the join is not done again on next reads
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    @rawtext.setter
+    def rawtext(self, text):
+        self._chunks = [text] if text else []
 
     def append_text(self, text):
         """Appends some raw text to the current node.
 
         :param str text: The text to append.
         """
-        self.rawtext += text
+        self._chunks.append(text)
 
-    def to_gemtext(self, options={}):
+    def to_gemtext(self):
         """Generates the Gemtext markup from the current node."""
         raise NotImplementedError()
 
+    def write_gemtext(self, output):
+        """Writes the Gemtext markup of the current node into the given stream.
+
+        :param output: A writable text stream (e.g. ``io.StringIO``).
+        """
+        output.write(self.to_gemtext())
+
 
 class NodeGroup(Node):
     """Base class to implement groups of Gemini text nodes."""
 
+    __slots__ = ("nodes",)
+
     def __init__(self, rst_node):
         Node.__init__(self, rst_node)
         #: Nodes of the group
@@ -174,44 +345,61 @@ class NodeGroup(Node):
     def to_gemtext(self):
         return "\n".join([node.to_gemtext() for node in self.nodes])
 
+    def write_gemtext(self, output):
+        # Subclasses that override to_gemtext() define their own rendering
+        if type(self).to_gemtext is not NodeGroup.to_gemtext:
+            Node.write_gemtext(self, output)
+            return
+        for i, node in enumerate(self.nodes):
+            if i:
+                output.write("\n")
+            node.write_gemtext(output)
+
 
 class ParagraphNode(Node):
+    __slots__ = ()
+
     def to_gemtext(self):
         return remove_newlines(self.rawtext)
 
 
 class TitleNode(Node):
+    __slots__ = ("level",)
+
     def __init__(self, rst_node, level=1):
         Node.__init__(self, rst_node)
         self.level = level
 
     def to_gemtext(self):
-        return " ".join(
-            [
-                "#" * max(1, min(3, self.level)),
-                self.rawtext,
-            ]
-        )
+        level = self.level
+        if level > 3:
+            level = 3
+        elif level < 1:
+            level = 1
+        return _TITLE_PREFIXES[level - 1] + self.rawtext
 
 
 class PreformattedTextNode(Node):
+    __slots__ = ("alt",)
+
     def __init__(self, rst_node, alt=""):
         Node.__init__(self, rst_node)
         self.alt = alt
 
     def to_gemtext(self):
-        return "```%s\n%s\n```" % (
-            self.alt,
-            self.rawtext,
-        )
+        return f"```{self.alt}\n{self.rawtext}\n```"
 
 
 class BlockQuoteNode(NodeGroup):
+    __slots__ = ()
+
     def to_gemtext(self):
-        return "\n>\n".join(["> %s" % node.to_gemtext() for node in self.nodes])
+        return "\n>\n".join([f"> {node.to_gemtext()}" for node in self.nodes])
 
 
 class BulletListNode(NodeGroup):
+    __slots__ = ()
+
     def to_gemtext(self):
         items = []
         for node in self.nodes:
@@ -223,11 +411,15 @@ class BulletListNode(NodeGroup):
 
 
 class ListItemNode(Node):
+    __slots__ = ()
+
     def to_gemtext(self):
         return remove_newlines(self.rawtext)
 
 
 class EnumaratedListNode(BulletListNode):
+    __slots__ = ("enumtype", "prefix", "suffix", "start")
+
     def __init__(self, node, enumtype="arabic", prefix="", suffix=".", start=1):
         BulletListNode.__init__(self, node)
         self.enumtype = enumtype
@@ -239,45 +431,36 @@ class EnumaratedListNode(BulletListNode):
         return str(number)
 
     def _to_loweralpha(self, number):
-        glyphs = "abcdefghijklmnopqrstuvwxyz"
-        result = ""
-        while number:
-            number -= 1
-            result += glyphs[number % len(glyphs)]
-            number //= len(glyphs)
-        return result[::-1]
+        return _number_to_loweralpha(number)
 
     def _to_upperalpha(self, number):
-        return self._to_loweralpha(number).upper()
+        return _number_to_upperalpha(number)
 
     def _to_lowerroman(self, number):
-        return docutils.utils.roman.toRoman(number).lower()
+        return _number_to_lowerroman(number)
 
     def _to_upperroman(self, number):
-        return docutils.utils.roman.toRoman(number)
+        return _number_to_upperroman(number)
 
     def to_gemtext(self):
-        items = []
-        i = self.start
         convertor = getattr(self, "_to_%s" % self.enumtype)
-        for node in self.nodes:
-            if type(node) is ListItemNode:
-                items.append(
-                    "* %s%s%s %s"
-                    % (
-                        self.prefix,
-                        convertor(i),
-                        self.suffix,
-                        node.to_gemtext(),
-                    )
+        prefix = "* " + self.prefix
+        suffix = self.suffix + " "
+        return "\n".join(
+            [
+                (
+                    f"{prefix}{convertor(i)}{suffix}{node.to_gemtext()}"
+                    if type(node) is ListItemNode
+                    else node.to_gemtext()
                 )
-            else:
-                items.append(node.to_gemtext())
-            i += 1
-        return "\n".join(items)
+                for i, node in enumerate(self.nodes, self.start)
+            ]
+        )
 
 
 class SystemMessageNode(NodeGroup):
+    __slots__ = ("level", "source", "line", "type_")
+
     def __init__(self, rst_node, level=1, source="document", line=0, type_="info"):
         NodeGroup.__init__(self, rst_node)
         self.level = level
@@ -295,6 +478,8 @@ class SystemMessageNode(NodeGroup):
 
 
 class LinkNode(Node):
+    __slots__ = ("refname", "uri")
+
     def __init__(self, rst_node, refname=None, uri=None, text=None):
         Node.__init__(self, rst_node)
         self.refname = refname
@@ -314,15 +499,19 @@ class LinkNode(Node):
 
 
 class LinkGroupNode(NodeGroup):
-    pass
+    __slots__ = ()
 
 
 class SeparatorNode(Node):
+    __slots__ = ()
+
     def to_gemtext(self):
-        return "-" * 80
+        return _SEPARATOR_LINE
 
 
 class RawNode(Node):
+    __slots__ = ("format",)
+
     def __init__(self, rst_node, format_):
         Node.__init__(self, rst_node)
         self.format = format_
@@ -332,10 +521,25 @@ class RawNode(Node):
 
 
 class FigureNode(NodeGroup):
-    pass
+    __slots__ = ()
 
 
 class AdmonitionNode(NodeGroup):
+    __slots__ = ("type", "title")
+
+    #: Default titles of the admonitions, by type
+    _TITLES = {
+        "note": "📝️ Note:",
+        "hint": "💡️ Hint",
+        "tip": "💡️ Tip",
+        "important": "‼️ Important",
+        "attention": "⚠️ Attention",
+        "warning": "⚠️ Warning",
+        "caution": "⚠️ Caution",
+        "danger": "⚠️ Danger",
+        "error": "⛔️ Error",
+    }
+
     def __init__(self, rst_node, type_=None, title=None):
         NodeGroup.__init__(self, rst_node)
         self.type = type_
@@ -344,37 +548,25 @@ class AdmonitionNode(NodeGroup):
     def gen_title(self):
         if self.title:
             return self.title
-        if self.type == "note":
-            return "📝️ Note:"
-        if self.type == "hint":
-            return "💡️ Hint"
-        if self.type == "tip":
-            return "💡️ Tip"
-        if self.type == "important":
-            return "‼️ Important"
-        if self.type == "attention":
-            return "⚠️ Attention"
-        if self.type == "warning":
-            return "⚠️ Warning"
-        if self.type == "caution":
-            return "⚠️ Caution"
-        if self.type == "danger":
-            return "⚠️ Danger"
-        if self.type == "error":
-            return "⛔️ Error"
-        return ""
+        return self._TITLES.get(self.type, "")
 
     def to_gemtext(self):
-        result = "-" * 80
-        result += "\n"
-        result += self.gen_title()
-        result += "\n"
-        result += "-" * 80
-        result += "\n"
-        result += NodeGroup.to_gemtext(self)
-        result += "\n"
-        result += "-" * 80
-        return result
+        return "\n".join(
+            [
+                _SEPARATOR_LINE,
+                self.gen_title(),
+                _SEPARATOR_LINE,
+                NodeGroup.to_gemtext(self),
+                _SEPARATOR_LINE,
+            ]
+        )
+
+
+#: Gemtext nodes that render lists
+_LIST_NODE_TYPES = (BulletListNode, EnumaratedListNode)
+
+#: Gemtext nodes that render links
+_LINK_NODE_TYPES = (LinkNode, LinkGroupNode)
 
 
 class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
@@ -382,24 +574,48 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
 
     #: Nodes to ignore as there is no equivalent markup in Gemtext.
     #: NOTE: the text inside the notes will be added to the parent node.
-    _NOP_NODES = [
-        "emphasis",
-        "literal",
-        "strong",
-        "target",
-    ]
+    _NOP_NODES = frozenset(
+        [
+            "emphasis",
+            "literal",
+            "strong",
+            "target",
+        ]
+    )
 
     #: Nodes that should be completely ignored with their content
-    _SKIPPED_NODES = [
-        "field_list",  # TODO Handle fields as metadata
-        "comment",
-        "substitution_definition",
-        "topic",  # .. contents:: (ToC)
-    ]
+    _SKIPPED_NODES = frozenset(
+        [
+            "field_list",  # TODO Handle fields as metadata
+            "comment",
+            "substitution_definition",
+            "topic",  # .. contents:: (ToC)
+        ]
+    )
+
+    #: Visit and departure functions already resolved, by reStructuredText
+    #: node class
+    _dispatch_functions = {}
 
     def __init__(self, document):
         docutils.nodes.GenericNodeVisitor.__init__(self, document)
+        if not self._dispatch_functions:
+            self._build_dispatch_functions()
+        self.reset(document)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses can override methods: they need their own cache
+        cls._dispatch_functions = {}
 
+    def reset(self, document):
+        """Prepares the translator to translate a new document. The functions
+        already resolved to visit and depart the nodes are kept.
+
+        :param document: The reStructuredText document to translate (from
+                         :py:func:`parse_rst`).
+        """
+        self.document = document
         #: List of Gemtext nodes that compose the final document.
         self.nodes = []
         #: List of messages generated by docutils
@@ -408,8 +624,11 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
         self._current_node = None
         #: The current section level (used for the titles level)
         self._section_level = 0
-        #: The node that is being skipped
-        self._skipped_node = None
+        #: Lines of the original reST text (only split when a table needs it)
+        self._source_lines = None
+        #: Position in the node list of the nodes appended with
+        #: _append_split_node(), by id of their reStructuredText node
+        self._split_indexes = {}
 
         # Check the document object is patched and contains the original reST
         # text. This is required for tables
@@ -419,26 +638,134 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
                 "Please use the rst2gemtext.parse_rst method to create the document object."
             )
 
-    def dispatch_visit(self, rst_node):
-        if self._skipped_node:
-            return
-        if rst_node.tagname in self._SKIPPED_NODES:
-            self._skipped_node = rst_node
-            return
-        if rst_node.tagname in self._NOP_NODES:
-            return
+    @classmethod
+    def _resolve_dispatch_functions(cls, rst_node_class):
+        """Finds the functions that handle the visit and the departure of the
+        given reStructuredText node class, and caches them.
 
-        docutils.nodes.GenericNodeVisitor.dispatch_visit(self, rst_node)
+        :param rst_node_class: The class of the reStructuredText node.
 
-    def dispatch_departure(self, rst_node):
-        if self._skipped_node:
-            if self._skipped_node is rst_node:
-                self._skipped_node = None
-            return
-        if rst_node.tagname in self._NOP_NODES:
-            return
+        :rtype: (function, function)
+        :return: The visit and the departure functions.
+        """
+        name = rst_node_class.__name__
+        tagname = rst_node_class.tagname or name
+        if tagname in cls._SKIPPED_NODES:
+            # Skipped nodes are never departed
+            functions = (cls._skip_node, cls._ignore_node)
+        elif tagname in cls._NOP_NODES:
+            functions = (cls._ignore_node, cls._ignore_node)
+        else:
+            functions = (
+                getattr(cls, "visit_%s" % name, cls.unknown_visit),
+                getattr(cls, "depart_%s" % name, cls.unknown_departure),
+            )
+        cls._dispatch_functions[rst_node_class] = functions
+        return functions
+
+    @classmethod
+    def _build_dispatch_functions(cls):
+        """Resolves the visit and departure functions of all the standard
+        docutils nodes at once. This is done when the class is first
+        instantiated, so methods added after the class creation (like the
+        admonition ones) are taken into account. Other node classes are still
+        resolved on their first visit.
+        """
+        cls._resolve_dispatch_functions(docutils.nodes.Text)
+        for name in docutils.nodes.node_class_names:
+            cls._resolve_dispatch_functions(getattr(docutils.nodes, name))
+
+    def _ignore_node(self, rst_node):
+        """Visit and departure function of the nodes in ``_NOP_NODES``."""
+        pass
+
+    def _skip_node(self, rst_node):
+        """Visit function of the nodes in ``_SKIPPED_NODES``."""
+        raise docutils.nodes.SkipNode()
 
-        docutils.nodes.GenericNodeVisitor.dispatch_departure(self, rst_node)
+    def dispatch_visit(self, rst_node):
+        functions = self._dispatch_functions.get(rst_node.__class__)
+        if functions is None:
+            functions = self._resolve_dispatch_functions(rst_node.__class__)
+        return functions[0](self, rst_node)
+
+    def dispatch_departure(self, rst_node):
+        functions = self._dispatch_functions.get(rst_node.__class__)
+        if functions is None:
+            functions = self._resolve_dispatch_functions(rst_node.__class__)
+        return functions[1](self, rst_node)
+
+    def walkabout(self, rst_node):
+        """Traverses the reStructuredText node tree, calling the visit and
+        departure functions of each node. This is equivalent to
+        ``rst_node.walkabout(translator)`` (the docutils traversal exceptions
+        are handled the same way), but uses an explicit stack instead of
+        recursive calls.
+
+        :param rst_node: The root of the reStructuredText node tree.
+        """
+        # Nodes being traversed: [node, whether to depart it, iterator over the
+        # children that are not visited yet]
+        stack = []
+        stop = False
+        next_rst_node = rst_node
+        while True:
+            if next_rst_node is not None:
+                node, next_rst_node = next_rst_node, None
+                call_depart = True
+                try:
+                    self.dispatch_visit(node)
+                except docutils.nodes.SkipNode:
+                    children = None
+                except docutils.nodes.SkipDeparture:
+                    call_depart = False
+                    children = node.children[:]
+                except docutils.nodes.SkipChildren:
+                    children = ()
+                except docutils.nodes.StopTraversal:
+                    children = ()
+                    stop = True
+                except docutils.nodes.SkipSiblings:
+                    if not stack:
+                        raise
+                    children = None
+                    stack[-1][2] = iter(())
+                else:
+                    # Read after the visit, that can change the children
+                    children = node.children[:]
+                if children is not None:
+                    stack.append([node, call_depart, iter(children)])
+            if not stack:
+                return
+            entry = stack[-1]
+            if not stop:
+                next_rst_node = next(entry[2], None)
+                if next_rst_node is not None:
+                    continue
+            stack.pop()
+            if entry[1]:
+                try:
+                    self.dispatch_departure(entry[0])
+                except (docutils.nodes.SkipSiblings, docutils.nodes.SkipChildren):
+                    if not stack:
+                        raise
+                    stack[-1][2] = iter(())
+                    # Like docutils, this cancels an ongoing StopTraversal:
+                    # the parent is departed and its siblings are visited
+                    stop = False
+                except docutils.nodes.StopTraversal:
+                    if not stack:
+                        raise
+                    stop = True
+
+    def _append_split_node(self, node):
+        """Appends a node to the node list and remembers its position so the
+        list can later be split on it with :meth:`_split_nodes`.
+
+        :param Node node: The node to append
+        """
+        self._split_indexes[id(node.rst_node)] = len(self.nodes)
+        self.nodes.append(node)
 
     def _split_nodes(self, rst_node):
         """Split the node list on the given rst_node.
@@ -446,13 +773,40 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
         :rtype: list[Node]
         :return: The nodes below the rst_node
         """
-        for i in range(len(self.nodes)):
-            if self.nodes[i].rst_node is rst_node:
-                break
+        i = self._split_indexes.pop(id(rst_node))
         splitted = self.nodes[i:]
-        self.nodes = self.nodes[:i]
+        del self.nodes[i:]
         return splitted
 
+    def _depart_node_group_with_links(self, rst_node):
+        """Departs a node group that cannot contain links: the links found
+        below the rst_node are moved after the group.
+
+        :param rst_node: The reStructuredText node
+        """
+        nodes = self._split_nodes(rst_node)
+        node_group = nodes.pop(0)
+        links = []
+
+        for node in nodes:
+            if type(node) is LinkNode:
+                links.append(node)
+            elif type(node) is LinkGroupNode:
+                links.extend(node.nodes)
+            else:
+                node_group.nodes.append(node)
+
+        if node_group.nodes:
+            self.nodes.append(node_group)
+
+        if links:
+            if len(links) == 1:
+                self.nodes.append(links[0])
+            else:
+                link_group_node = LinkGroupNode(None)
+                link_group_node.nodes = links
+                self.nodes.append(link_group_node)
+
     # ==== RST NODES ====
 
     # admonition
@@ -460,7 +814,7 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     def visit_admonition(self, rst_node, type_=None):
         admonition_node = AdmonitionNode(rst_node, type_)
         self._current_node = None  # To catch eventual errors
-        self.nodes.append(admonition_node)
+        self._append_split_node(admonition_node)
 
     def depart_admonition(self, rst_node):
         nodes = self._split_nodes(rst_node)
@@ -472,73 +826,25 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
         admonition_node.nodes = nodes
         self.nodes.append(admonition_node)
 
-    # attention (admonition)
-
-    def visit_attention(self, rst_node):
-        self.visit_admonition(rst_node, type_="attention")
-
-    def depart_attention(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # block_quote
 
     def visit_block_quote(self, rst_node):
         block_quote_node = BlockQuoteNode(rst_node)
         self._current_node = None  # To catch eventual errors
-        self.nodes.append(block_quote_node)
+        self._append_split_node(block_quote_node)
 
     def depart_block_quote(self, rst_node):
-        nodes = self._split_nodes(rst_node)
-        block_quote_node = nodes.pop(0)
-
-        links = []
-
-        for node in nodes:
-            if type(node) is LinkNode:
-                links.append(node)
-            elif type(node) is LinkGroupNode:
-                links.extend(node.nodes)
-            else:
-                block_quote_node.nodes.append(node)
-
-        if block_quote_node.nodes:
-            self.nodes.append(block_quote_node)
-
-        if links:
-            if len(links) == 1:
-                self.nodes.append(links[0])
-            else:
-                link_group_node = LinkGroupNode(None)
-                link_group_node.nodes = links
-                self.nodes.append(link_group_node)
+        self._depart_node_group_with_links(rst_node)
 
     # bullet_list
 
     def visit_bullet_list(self, rst_node):
         bullet_list_node = BulletListNode(rst_node)
         self._current_node = None  # To catch eventual errors
-        self.nodes.append(bullet_list_node)
+        self._append_split_node(bullet_list_node)
 
     def depart_bullet_list(self, rst_node):
-        nodes = self._split_nodes(rst_node)
-        bullet_list_node = nodes.pop(0)
-        links = []
-        for node in nodes:
-            if type(node) is LinkNode:
-                links.append(node)
-            elif type(node) is LinkGroupNode:
-                links.extend(node.nodes)
-            else:
-                bullet_list_node.nodes.append(node)
-        if bullet_list_node.nodes:
-            self.nodes.append(bullet_list_node)
-        if links:
-            if len(links) == 1:
-                self.nodes.append(links[0])
-            else:
-                link_group_node = LinkGroupNode(None)
-                link_group_node.nodes = links
-                self.nodes.append(link_group_node)
+        self._depart_node_group_with_links(rst_node)
 
     # caption
 
@@ -548,56 +854,35 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     def depart_caption(self, rst_node):
         self.depart_paragraph(rst_node)
 
-    # caution (admonition)
-
-    def visit_caution(self, rst_node):
-        self.visit_admonition(rst_node, type_="caution")
-
-    def depart_caution(self, rst_node):
-        self.depart_admonition(rst_node)
-
-    # danger (admonition)
-
-    def visit_danger(self, rst_node):
-        self.visit_admonition(rst_node, type_="danger")
-
-    def depart_danger(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # enumerated_list
 
     def visit_enumerated_list(self, rst_node):
+        attrs = rst_node.attributes
         enumerated_list_node = EnumaratedListNode(
             rst_node,
-            enumtype=rst_node.attributes["enumtype"],
-            prefix=rst_node.attributes["prefix"],
-            suffix=rst_node.attributes["suffix"],
-            start=rst_node.attributes["start"] if "start" in rst_node.attributes else 1,
+            enumtype=attrs["enumtype"],
+            prefix=attrs["prefix"],
+            suffix=attrs["suffix"],
+            start=attrs.get("start", 1),
         )
         self._current_node = None  # To catch eventual errors
-        self.nodes.append(enumerated_list_node)
+        self._append_split_node(enumerated_list_node)
 
     def depart_enumerated_list(self, rst_node):
         self.depart_bullet_list(rst_node)
 
-    # error (admonition)
-
-    def visit_error(self, rst_node):
-        self.visit_admonition(rst_node, type_="error")
-
-    def depart_error(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # figure
 
     def visit_figure(self, rst_node):
         figure_node = FigureNode(rst_node)
         self._current_node = None
-        self.nodes.append(figure_node)
+        self._append_split_node(figure_node)
 
     def depart_figure(self, rst_node):
         nodes = self._split_nodes(rst_node)
         figure_node = nodes.pop(0)
+        # Number of nodes of the figure for each rawtext
+        rawtexts = collections.Counter()
         for node in nodes:
             if (
                 type(node) is LinkNode
@@ -610,20 +895,21 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
                         figure_node.nodes.append(prev_node)
                     else:
                         figure_node.nodes.append(node)
+                        rawtexts[prev_node.rawtext] -= 1
+                        rawtexts[node.rawtext] += 1
                 else:
                     # Swap link / image
                     figure_node.nodes.append(node)
                     figure_node.nodes.append(prev_node)
+                    rawtexts[node.rawtext] += 1
             elif type(node) is ParagraphNode:
-                caption_is_alttext = False
-                for fnode in figure_node.nodes:
-                    if fnode.rawtext == node.rawtext:
-                        caption_is_alttext = True
-                        break
-                if not caption_is_alttext:
+                # Do not repeat the caption if it is already the alt text
+                if rawtexts[node.rawtext] <= 0:
                     figure_node.nodes.append(node)
+                    rawtexts[node.rawtext] += 1
             else:
                 figure_node.nodes.append(node)
+                rawtexts[node.rawtext] += 1
         if (
             type(figure_node.nodes[0]) is LinkNode
             and type(figure_node.nodes[-1]) is ParagraphNode
@@ -633,51 +919,36 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
                 figure_node.nodes[0].rawtext = caption.rawtext
         self.nodes.append(figure_node)
 
-    # hint (admonition)
-
-    def visit_hint(self, rst_node):
-        self.visit_admonition(rst_node, type_="hint")
-
-    def depart_hint(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # image
 
     def visit_image(self, rst_node):
+        attrs = rst_node.attributes
         link_node = LinkNode(
             rst_node,
-            uri=rst_node.attributes["uri"],
-            text=rst_node.attributes["alt"] if "alt" in rst_node.attributes else None,
+            uri=attrs["uri"],
+            text=attrs.get("alt"),
         )
         self.nodes.append(link_node)
 
     def depart_image(self, rst_node):
         pass
 
-    # important (admonition)
-
-    def visit_important(self, rst_node):
-        self.visit_admonition(rst_node, type_="important")
-
-    def depart_important(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # list_item
 
     def visit_list_item(self, rst_node):
         list_item_node = ListItemNode(rst_node)
         self._current_node = None  # To catch eventual errors
-        self.nodes.append(list_item_node)
+        self._append_split_node(list_item_node)
 
     def depart_list_item(self, rst_node):
         nodes = self._split_nodes(rst_node)
         list_item_node = nodes.pop(0)
         for node in nodes:
-            if type(node) in [BulletListNode, EnumaratedListNode]:
+            if isinstance(node, _LIST_NODE_TYPES):
                 self.nodes.append(list_item_node)
                 self.nodes.append(node)
                 list_item_node = ListItemNode(node)
-            elif type(node) in [LinkNode, LinkGroupNode]:
+            elif isinstance(node, _LINK_NODE_TYPES):
                 self.nodes.append(node)
             else:
                 if list_item_node.rawtext:
@@ -689,32 +960,27 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     # literal_block
 
     def visit_literal_block(self, rst_node):
-        alt = ""
-        for class_ in rst_node.attributes["classes"]:
-            if class_ != "code":
-                alt = class_
-                break
+        # The language of code blocks is the first class that is not "code"
+        classes = rst_node.attributes["classes"]
+        alt = next((class_ for class_ in classes if class_ != "code"), "")
         preformatted_text_node = PreformattedTextNode(rst_node, alt=alt)
         self._current_node = preformatted_text_node
         self.nodes.append(preformatted_text_node)
+        # Most blocks hold a single Text node: take it without visiting it
+        children = rst_node.children
+        if len(children) == 1 and isinstance(children[0], docutils.nodes.Text):
+            preformatted_text_node.rawtext = children[0].astext()
+            raise docutils.nodes.SkipChildren()
 
     def depart_literal_block(self, rst_node):
         pass
 
-    # note (admonition)
-
-    def visit_note(self, rst_node):
-        self.visit_admonition(rst_node, type_="note")
-
-    def depart_note(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # paragraph
 
     def visit_paragraph(self, rst_node):
         paragraph_node = ParagraphNode(rst_node)
         self._current_node = paragraph_node
-        self.nodes.append(paragraph_node)
+        self._append_split_node(paragraph_node)
 
     def depart_paragraph(self, rst_node):
         nodes = self._split_nodes(rst_node)
@@ -723,7 +989,8 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
         if len(nodes) == 1 and nodes[0].rawtext == paragraph_node.rawtext:
             self.nodes.append(nodes[0])
         else:
-            if paragraph_node.to_gemtext().strip():
+            rawtext = paragraph_node.rawtext
+            if rawtext and not rawtext.isspace():
                 self.nodes.append(paragraph_node)
             if nodes:
                 link_group_node = LinkGroupNode(rst_node)
@@ -744,28 +1011,19 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     # reference
 
     def visit_reference(self, rst_node):
-        text = ""
+        texts = []
         for child_node in rst_node.children:
-            if child_node.tagname == "image":
+            tagname = child_node.tagname
+            if tagname == "image":
                 continue
-            elif child_node.tagname != "#text":
-                raise ValueError(
-                    "Unexpected tag found in a reference: %s" % child_node.tagname
-                )
-            text += child_node.astext()
-        text = remove_newlines(text)
+            elif tagname != "#text":
+                raise ValueError("Unexpected tag found in a reference: %s" % tagname)
+            texts.append(child_node.astext())
+        text = remove_newlines("".join(texts))
         link_node = LinkNode(
             rst_node,
-            refname=(
-                rst_node.attributes["refname"]
-                if "refname" in rst_node.attributes
-                else None
-            ),
-            uri=(
-                rst_node.attributes["refuri"]
-                if "refuri" in rst_node.attributes
-                else None
-            ),
+            refname=rst_node.attributes.get("refname"),
+            uri=rst_node.attributes.get("refuri"),
             text=text if text else None,
         )
         self.nodes.append(link_node)
@@ -784,15 +1042,16 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     # system_message
 
     def visit_system_message(self, rst_node):
+        attrs = rst_node.attributes
         system_message_node = SystemMessageNode(
             rst_node,
-            level=rst_node.attributes["level"],
-            line=rst_node.attributes["line"],
-            source=rst_node.attributes["source"],
-            type_=rst_node.attributes["type"],
+            level=attrs["level"],
+            line=attrs["line"],
+            source=attrs["source"],
+            type_=attrs["type"],
         )
         self._current_node = None  # To catch eventual errors
-        self.nodes.append(system_message_node)
+        self._append_split_node(system_message_node)
 
     def depart_system_message(self, rst_node):
         nodes = self._split_nodes(rst_node)
@@ -805,7 +1064,7 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     def visit_table(self, rst_node):
         preformatted_text_node = PreformattedTextNode(rst_node)
         self._current_node = None  # To catch eventual errors
-        self.nodes.append(preformatted_text_node)
+        self._append_split_node(preformatted_text_node)
 
     def depart_table(self, rst_node):
         # TODO: handle links
@@ -813,26 +1072,31 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
         preformatted_text_node = nodes.pop(0)
 
         title = ""
-        line_min = math.inf
+        line_min = None
         line_max = 0
+        # A same rst node can be reached from several Gemtext nodes (e.g. a
+        # reference from both its paragraph and its link node)
+        end_lines = {}
 
         for node in flatten_node_tree(nodes):
             if isinstance(node, TitleNode):
                 title = node.rawtext
                 continue
-            nodes = search_lines_recursive(node.rst_node)
-            for node in nodes:
-                node_start_line = node.line
-                node_end_line = get_node_end_line(node)
-                if node_start_line < line_min:
-                    line_min = node_start_line
-                elif node_end_line > line_max:
-                    line_max = node_end_line
+            for line_rst_node in search_lines_recursive(node.rst_node):
+                if line_min is None or line_rst_node.line < line_min:
+                    line_min = line_rst_node.line
+                    continue
+                if id(line_rst_node) not in end_lines:
+                    end_lines[id(line_rst_node)] = get_node_end_line(line_rst_node)
+                if end_lines[id(line_rst_node)] > line_max:
+                    line_max = end_lines[id(line_rst_node)]
         line_min -= 1
         line_max += 1
 
-        table_lines = self.document._original_rst.split("\n")[line_min - 1 : line_max]
-        indent = len(re.match(r"^(\s*).*$", table_lines[0]).group(1))
+        if self._source_lines is None:
+            self._source_lines = self.document._original_rst.split("\n")
+        table_lines = self._source_lines[line_min - 1 : line_max]
+        indent = len(table_lines[0]) - len(table_lines[0].lstrip())
 
         preformatted_text_node.append_text(
             "\n".join([line[indent:] for line in table_lines])
@@ -846,19 +1110,13 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     # Text (leaf)
 
     def visit_Text(self, rst_node):
+        # NOTE: astext() is required: it removes the null characters docutils
+        # uses to mark backslash-escaped characters in the raw node string.
         self._current_node.append_text(rst_node.astext())
 
     def depart_Text(self, rst_node):
         pass
 
-    # tip (admonition)
-
-    def visit_tip(self, rst_node):
-        self.visit_admonition(rst_node, type_="tip")
-
-    def depart_tip(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # title
 
     def visit_title(self, rst_node):
@@ -877,14 +1135,6 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
     def depart_transition(self, rst_node):
         pass
 
-    # warning (admonition)
-
-    def visit_warning(self, rst_node):
-        self.visit_admonition(rst_node, type_="warning")
-
-    def depart_warning(self, rst_node):
-        self.depart_admonition(rst_node)
-
     # ==== DEFAULT ====
 
     def default_visit(self, rst_node):
@@ -896,27 +1146,66 @@ class GemtextTranslator(docutils.nodes.GenericNodeVisitor):
         pass
 
 
+def _make_admonition_visitors(type_):
+    """Makes the visit and depart methods of a typed admonition (note,
+    warning,...).
+
+    :param str type_: The admonition type.
+
+    :rtype: (function, function)
+    """
+
+    def visit(self, rst_node):
+        self.visit_admonition(rst_node, type_=type_)
+
+    def depart(self, rst_node):
+        self.depart_admonition(rst_node)
+
+    visit.__name__ = visit.__qualname__ = "visit_%s" % type_
+    depart.__name__ = depart.__qualname__ = "depart_%s" % type_
+    return visit, depart
+
+
+# attention, caution, danger, error, hint, important, note, tip, warning
+for _admonition_type in AdmonitionNode._TITLES:
+    _visit, _depart = _make_admonition_visitors(_admonition_type)
+    setattr(GemtextTranslator, "visit_%s" % _admonition_type, _visit)
+    setattr(GemtextTranslator, "depart_%s" % _admonition_type, _depart)
+del _admonition_type, _visit, _depart
+
+
 class GemtextWriter(docutils.writers.Writer):
     """Write Gemtext from reStructuredText ducument."""
 
+    #: Transforms applied to the document before its translation
+    transforms = (
+        docutils.transforms.references.Substitutions,
+        docutils.transforms.references.ExternalTargets,
+    )
+
     def __init__(self):
         docutils.writers.Writer.__init__(self)
-        self.transforms = [
-            docutils.transforms.references.Substitutions,
-            docutils.transforms.references.ExternalTargets,
-        ]
+        # Per-instance copy, so instances can append their own transforms
+        self.transforms = list(type(self).transforms)
         self.visitor = None
 
     def translate(self):
-        self.visitor = GemtextTranslator(self.document)
+        if self.visitor is None:
+            self.visitor = GemtextTranslator(self.document)
+        else:
+            self.visitor.reset(self.document)
         for Transform in self.transforms:
             transform = Transform(self.document)
             transform.apply()
-        self.document.walkabout(self.visitor)
+        self.visitor.walkabout(self.document)
         self._before_translate_output_generation_hook()
-        self.output = (
-            "\n\n".join([node.to_gemtext() for node in self.visitor.nodes]) + "\n"
-        )
+        output = StringIO()
+        for i, node in enumerate(self.visitor.nodes):
+            if i:
+                output.write("\n\n")
+            node.write_gemtext(output)
+        output.write("\n")
+        self.output = output.getvalue()
 
     def _before_translate_output_generation_hook(self):
         """Method called just before generating the final GemText document. At
@@ -934,9 +1223,57 @@ class GemtextWriter(docutils.writers.Writer):
         pass
 
 
+def _is_plain_text_node(rst_node):
+    """Checks that the given node only contains text, possibly wrapped in
+    inline markup that has no equivalent in Gemtext (emphasis, strong,...).
+
+    :param rst_node: any rst node from docutils.
+
+    :rtype: bool
+    """
+    for child_rst_node in rst_node.children:
+        if isinstance(child_rst_node, docutils.nodes.Text):
+            continue
+        if child_rst_node.tagname not in GemtextTranslator._NOP_NODES:
+            return False
+        if not _is_plain_text_node(child_rst_node):
+            return False
+    return True
+
+
+def _convert_document(document):
+    """Convert a parsed reStructuredText document to Gemtext.
+
+    :param docutils.nodes.document document: The document, as returned by
+                                             :func:`parse_rst`.
+
+    :rtype: str
+    :return: The converted Gemtext.
+    """
+    # Fast path: a single paragraph of text does not need the whole
+    # translation machinery
+    if (
+        len(document.children) == 1
+        and isinstance(document.children[0], docutils.nodes.paragraph)
+        and _is_plain_text_node(document.children[0])
+    ):
+        text = remove_newlines(document.children[0].astext())
+        return text + "\n" if text.strip() else "\n"
+
+    writer = GemtextWriter()
+    writer.write(document, docutils.io.NullOutput())
+    return writer.output
+
+
 def convert(rst_text, source_path="document"):
     """Convert the input reStructuredText to Gemtext.
 
+    Results are cached: converting the same text again returns the
+    previously converted Gemtext. The least recently used results are evicted
+    first when the cache is full. Documents that depend on other files (e.g.
+    with an ``include`` directive) are never cached. The cache can be emptied
+    with ``convert.cache_clear()``.
+
     :param str rst_text: The input reStructuredText.
     :param str source_path: The path of the source reStructuredText file
                             (optional, but required if the document contains an
@@ -945,12 +1282,167 @@ def convert(rst_text, source_path="document"):
     :rtype: str
     :return: The converted Gemtext.
     """
+    cache_key = (rst_text, source_path)
+    output_gemtext = _CONVERT_CACHE.get(cache_key)
+    if output_gemtext is not None:
+        try:
+            _CONVERT_CACHE.move_to_end(cache_key)
+        except KeyError:  # Evicted by another thread in the meantime
+            pass
+        return output_gemtext
+
     document = parse_rst(rst_text, source_path)
-    output_io = StringIO()
-    writer = GemtextWriter()
-    writer.write(document, output_io)
-    output_io.seek(0)
-    return output_io.read()
+    output_gemtext = _convert_document(document)
+
+    if not document.settings.record_dependencies.list:
+        if len(_CONVERT_CACHE) >= _CONVERT_CACHE_MAX_SIZE:
+            _CONVERT_CACHE.popitem(last=False)
+        _CONVERT_CACHE[cache_key] = output_gemtext
+
+    return output_gemtext
+
+
+convert.cache_clear = _CONVERT_CACHE.clear
+
+
+def _is_fast_convert_text(text):
+    """Checks whether a line of text (without its eventual list bullet) can be
+    converted by :func:`fast_convert`: it must be plain text, without any
+    markup, and it must not look like the start of a list item.
+
+    :param str text: The line to check.
+
+    :rtype: bool
+    """
+    if (
+        not text.isprintable()
+        or text[0] == " "
+        or text[0] in _FAST_CONVERT_SPECIAL_LINE_STARTS
+        or not _FAST_CONVERT_SPECIAL_CHARS.isdisjoint(text)
+        or not any(char.isalnum() for char in text)
+    ):
+        return False
+    # Enumerated list items ("1.", "a)", "iv.",...)
+    first_word = text.split(" ", 1)[0]
+    if first_word[-1] in ".)":
+        enumerator = first_word[:-1]
+        if (
+            not enumerator
+            or enumerator.isdigit()
+            or len(enumerator) == 1
+            or _ROMAN_NUMERAL_CHARS.issuperset(enumerator)
+        ):
+            return False
+    return True
+
+
+def _fast_convert_blocks(rst_text):
+    """Converts a reStructuredText document made only of plain paragraphs,
+    underlined section titles and bullet lists of one-line items.
+
+    :param str rst_text: The input reStructuredText.
+
+    :rtype: list[str] or None
+    :return: The Gemtext blocks, or ``None`` if the document contains anything
+             else.
+    """
+    blocks = []
+    block_lines = []
+    previous_bullet = None
+    # Underline characters of the section titles, by level - 1
+    title_styles = []
+    section_level = 0
+
+    # docutils turns these into spaces, but str.splitlines() splits on them
+    if "\v" in rst_text or "\f" in rst_text:
+        return None
+
+    for line in rst_text.splitlines() + [""]:
+        line = line.rstrip(" ")
+        if line:
+            block_lines.append(line)
+            continue
+        if not block_lines:
+            continue
+
+        first_line = block_lines[0]
+        bullet = None
+
+        if (
+            len(block_lines) == 2
+            and block_lines[1][0] in _SECTION_ADORNMENT_CHARS
+            and block_lines[1] == block_lines[1][0] * len(block_lines[1])
+        ):
+            # Section title
+            underline = block_lines[1]
+            if (
+                not first_line.isascii()
+                or len(underline) < len(first_line)
+                or not _is_fast_convert_text(first_line)
+            ):
+                return None
+            if underline[0] in title_styles:
+                level = title_styles.index(underline[0]) + 1
+                if level > section_level + 1:
+                    return None
+            elif len(title_styles) == section_level:
+                title_styles.append(underline[0])
+                level = len(title_styles)
+            else:
+                return None
+            section_level = level
+            blocks.append(_TITLE_PREFIXES[min(level, 3) - 1] + first_line)
+
+        elif first_line[:2] in _FAST_CONVERT_BULLETS:
+            # Bullet list
+            bullet = first_line[:2]
+            items = []
+            for item_line in block_lines:
+                if item_line[:2] != bullet or not _is_fast_convert_text(item_line[2:]):
+                    return None
+                items.append("* " + item_line[2:])
+            if bullet == previous_bullet:
+                # Items separated by blank lines still belong to the same list
+                items.insert(0, blocks.pop())
+            blocks.append("\n".join(items))
+
+        else:
+            # Paragraph
+            for paragraph_line in block_lines:
+                if not _is_fast_convert_text(paragraph_line):
+                    return None
+            blocks.append(" ".join(block_lines))
+
+        previous_bullet = bullet
+        block_lines = []
+
+    return blocks
+
+
+def fast_convert(rst_text, source_path="document"):
+    """Convert the input reStructuredText to Gemtext, without docutils for the
+    simplest documents.
+
+    Documents made only of plain paragraphs (no inline markup), underlined
+    section titles and bullet lists of one-line items are converted by a
+    line-based scanner. Any other document is converted by :func:`convert`.
+    The result is the same in both cases.
+
+    :param str rst_text: The input reStructuredText.
+    :param str source_path: The path of the source reStructuredText file
+                            (optional, but required if the document contains an
+                            ``include`` directive)
+
+    :rtype: str
+    :return: The converted Gemtext.
+
+    >>> fast_convert("Title\\n=====\\n\\nSome text.\\n\\n* foo\\n* bar\\n")
+    '# Title\\n\\nSome text.\\n\\n* foo\\n* bar\\n'
+    """
+    blocks = _fast_convert_blocks(rst_text)
+    if not blocks:
+        return convert(rst_text, source_path)
+    return "\n\n".join(blocks) + "\n"
 
 
 def main(args=sys.argv[1:]):
@@ -1,7 +1,10 @@
+import io
 import pathlib
 
 import pytest
+import docutils.io
 import docutils.nodes
+import docutils.transforms.universal
 
 import rst2gemtext
 
@@ -29,6 +32,15 @@ class Test_parse_rst:
         result = rst2gemtext.parse_rst("")
         assert isinstance(result, docutils.nodes.document)
 
+    def test_settings_not_shared_between_documents(self):
+        document1 = rst2gemtext.parse_rst("")
+        document2 = rst2gemtext.parse_rst("")
+        assert document1.settings is not document2.settings
+        assert (
+            document1.settings.record_dependencies
+            is not document2.settings.record_dependencies
+        )
+
 
 class Test_convert:
     @pytest.mark.parametrize("input_rst_file", [f.name for f in _FIXTURES])
@@ -44,6 +56,308 @@ class Test_convert:
         output_gemtext = rst2gemtext.convert(input_rst, source_rst_path)
         assert output_gemtext == expected_gemtext
 
+    @pytest.mark.parametrize(
+        "input_rst,expected_gemtext",
+        [
+            ("", "\n"),
+            ("Hello *world*\n**foo** ``bar``", "Hello world foo bar\n"),
+            (
+                "Hello `world <gemini://world>`_",
+                "Hello world\n\n=> gemini://world world\n",
+            ),
+        ],
+    )
+    def test_single_paragraph(self, input_rst, expected_gemtext):
+        assert rst2gemtext.convert(input_rst) == expected_gemtext
+
+    def test_backslash_escapes(self):
+        assert rst2gemtext.convert("* foo\\*bar\\ baz") == "* foo*barbaz\n"
+
+    def test_cache(self, monkeypatch):
+        parse_rst = rst2gemtext.parse_rst
+        parsed = []
+
+        def parse_rst_spy(*args):
+            parsed.append(args)
+            return parse_rst(*args)
+
+        monkeypatch.setattr(rst2gemtext, "parse_rst", parse_rst_spy)
+        rst2gemtext.convert.cache_clear()
+
+        assert rst2gemtext.convert("foo") == "foo\n"
+        assert rst2gemtext.convert("foo") == "foo\n"
+        assert len(parsed) == 1
+
+        rst2gemtext.convert.cache_clear()
+        assert rst2gemtext.convert("foo") == "foo\n"
+        assert len(parsed) == 2
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(rst2gemtext, "_CONVERT_CACHE_MAX_SIZE", 2)
+        rst2gemtext.convert.cache_clear()
+
+        rst2gemtext.convert("foo")
+        rst2gemtext.convert("bar")
+        rst2gemtext.convert("foo")
+        rst2gemtext.convert("baz")
+        assert ("foo", "document") in rst2gemtext._CONVERT_CACHE
+        assert ("bar", "document") not in rst2gemtext._CONVERT_CACHE
+
+    def test_cache_skips_documents_with_dependencies(self, monkeypatch):
+        source_rst_path = (_FIXTURES_PATH / "020_include.rst").as_posix()
+        with open(source_rst_path, "r") as file_:
+            input_rst = file_.read()
+
+        rst2gemtext.convert.cache_clear()
+        output_gemtext = rst2gemtext.convert(input_rst, source_rst_path)
+
+        monkeypatch.setattr(rst2gemtext, "_convert_document", lambda document: "")
+        assert rst2gemtext.convert(input_rst, source_rst_path) == ""
+        assert output_gemtext != ""
+
+    def test_successive_conversions(self):
+        assert rst2gemtext.convert("foo") == "foo\n"
+        assert rst2gemtext.convert("bar") == "bar\n"
+        assert rst2gemtext.convert("foo") == "foo\n"
+
+
+class Test_fast_convert:
+    @pytest.mark.parametrize("input_rst_file", [f.name for f in _FIXTURES])
+    def test_rst_document(self, input_rst_file):
+        source_rst_path = (_FIXTURES_PATH / input_rst_file).as_posix()
+
+        with open(source_rst_path, "r") as file_:
+            input_rst = file_.read()
+
+        with open((_FIXTURES_PATH / input_rst_file).with_suffix(".gmi"), "r") as file_:
+            expected_gemtext = file_.read()
+
+        output_gemtext = rst2gemtext.fast_convert(input_rst, source_rst_path)
+        assert output_gemtext == expected_gemtext
+
+    @pytest.mark.parametrize(
+        "input_rst",
+        [
+            "Hello world",
+            "Hello\r\nworld\n\nfoo  bar  \n",
+            "Title\n=====\n\nText.\n\nSub\n---\n\nFoo\n\nOther\n=====\n",
+            "A\n=\n\nB\n-\n\nC\n~\n\nD\n^\n\nE\n-\n",
+            "* foo\n* bar\n\n* baz\n\n- qux\n\n+ quux\n",
+            'Ünïcode paragraph, "quotes" and 100% (safe) text!',
+        ],
+    )
+    def test_simple_document(self, monkeypatch, input_rst):
+        expected_gemtext = rst2gemtext.convert(input_rst)
+        monkeypatch.setattr(rst2gemtext, "parse_rst", None)
+        assert rst2gemtext.fast_convert(input_rst) == expected_gemtext
+
+    @pytest.mark.parametrize(
+        "input_rst",
+        [
+            "",
+            "Hello *world*",
+            "See http://example.org",
+            "1. foo",
+            "A. Smith",
+            "iv) foo",
+            "(1) foo",
+            "  indented",
+            "foo\n* bar",
+            "* foo\n- bar",
+            "Title\n===",
+            "Title\n=====\nText",
+            "foo\n\n----\n\nbar",
+            "Tab\tseparated",
+            "foo\x0c\x0cbar",
+            "Title\x0c=====",
+            "foo\x0bbar",
+        ],
+    )
+    def test_fallback(self, input_rst):
+        assert rst2gemtext._fast_convert_blocks(input_rst) is None or not input_rst
+        assert rst2gemtext.fast_convert(input_rst) == rst2gemtext.convert(input_rst)
+
+
+class Test_GemtextTranslator:
+    def test_subclass_methods_are_dispatched(self):
+        visited = []
+
+        class Translator(rst2gemtext.GemtextTranslator):
+            def visit_paragraph(self, rst_node):
+                visited.append(rst_node)
+                rst2gemtext.GemtextTranslator.visit_paragraph(self, rst_node)
+
+        for translator_class in [rst2gemtext.GemtextTranslator, Translator]:
+            document = rst2gemtext.parse_rst("foo\n\nbar")
+            translator = translator_class(document)
+            document.walkabout(translator)
+            assert len(translator.nodes) == 2
+
+        assert len(visited) == 2
+
+    def test_dispatch_functions_are_built(self):
+        class Translator(rst2gemtext.GemtextTranslator):
+            pass
+
+        Translator(rst2gemtext.parse_rst("foo"))
+        functions = Translator._dispatch_functions[docutils.nodes.note]
+        assert functions == (Translator.visit_note, Translator.depart_note)
+
+    @pytest.mark.parametrize("rst_path", _FIXTURES)
+    def test_walkabout(self, rst_path):
+        class Translator(rst2gemtext.GemtextTranslator):
+            def dispatch_visit(self, rst_node):
+                self.events.append(("visit", rst_node))
+                return rst2gemtext.GemtextTranslator.dispatch_visit(self, rst_node)
+
+            def dispatch_departure(self, rst_node):
+                self.events.append(("depart", rst_node))
+                return rst2gemtext.GemtextTranslator.dispatch_departure(self, rst_node)
+
+        rst_text = rst_path.read_text()
+        document = rst2gemtext.parse_rst(rst_text, source_path=str(rst_path))
+        translator = Translator(document)
+        translator.events = []
+        document.walkabout(translator)
+        expected_events = translator.events
+
+        document = rst2gemtext.parse_rst(rst_text, source_path=str(rst_path))
+        translator = Translator(document)
+        translator.events = []
+        translator.walkabout(document)
+        events = translator.events
+
+        assert [(event, type(node)) for event, node in events] == [
+            (event, type(node)) for event, node in expected_events
+        ]
+
+    def test_walkabout_stop_traversal(self):
+        departed = []
+
+        class Translator(rst2gemtext.GemtextTranslator):
+            def visit_paragraph(self, rst_node):
+                raise docutils.nodes.StopTraversal()
+
+            def depart_paragraph(self, rst_node):
+                departed.append(rst_node)
+
+        document = rst2gemtext.parse_rst("foo\n\nbar")
+        Translator(document).walkabout(document)
+        assert len(departed) == 1
+
+    def test_walkabout_children_changed_by_visit(self):
+        class Translator(rst2gemtext.GemtextTranslator):
+            def visit_paragraph(self, rst_node):
+                rst_node.append(docutils.nodes.Text(" extra"))
+                rst2gemtext.GemtextTranslator.visit_paragraph(self, rst_node)
+
+        document = rst2gemtext.parse_rst("foo")
+        translator = Translator(document)
+        translator.walkabout(document)
+        assert [node.to_gemtext() for node in translator.nodes] == ["foo extra"]
+
+    def test_walkabout_stop_traversal_cancelled(self):
+        visited = []
+
+        class Translator(rst2gemtext.GemtextTranslator):
+            def visit_paragraph(self, rst_node):
+                visited.append(rst_node)
+                raise docutils.nodes.StopTraversal()
+
+            def depart_paragraph(self, rst_node):
+                pass
+
+            def visit_bullet_list(self, rst_node):
+                pass
+
+            def depart_bullet_list(self, rst_node):
+                pass
+
+            def visit_list_item(self, rst_node):
+                pass
+
+            def depart_list_item(self, rst_node):
+                raise docutils.nodes.SkipSiblings()
+
+        def walk(walkabout):
+            visited.clear()
+            document = rst2gemtext.parse_rst("* foo\n* bar\n\nbaz")
+            walkabout(document, Translator(document))
+            return [rst_node.astext() for rst_node in visited]
+
+        # docutils visits "baz": SkipSiblings cancels the StopTraversal
+        assert walk(docutils.nodes.Node.walkabout) == ["foo", "baz"]
+        assert walk(lambda document, translator: translator.walkabout(document)) == [
+            "foo",
+            "baz",
+        ]
+
+    def test_reset(self):
+        document = rst2gemtext.parse_rst("Title\n=====\n\nfoo")
+        translator = rst2gemtext.GemtextTranslator(document)
+        document.walkabout(translator)
+        document = rst2gemtext.parse_rst("bar")
+        translator.reset(document)
+        document.walkabout(translator)
+        assert [node.to_gemtext() for node in translator.nodes] == ["bar"]
+        assert translator._section_level == 0
+
+
+class Test_GemtextWriter:
+    def test_transforms_can_be_extended(self):
+        class Writer(rst2gemtext.GemtextWriter):
+            def __init__(self):
+                rst2gemtext.GemtextWriter.__init__(self)
+                self.transforms.append(docutils.transforms.universal.StripComments)
+
+        writer = Writer()
+        assert writer.transforms[-1] is docutils.transforms.universal.StripComments
+        assert docutils.transforms.universal.StripComments not in (
+            rst2gemtext.GemtextWriter().transforms
+        )
+
+    def test_visitor_is_reused(self):
+        writer = rst2gemtext.GemtextWriter()
+        output = docutils.io.NullOutput()
+        writer.write(rst2gemtext.parse_rst("foo"), output)
+        visitor = writer.visitor
+        writer.write(rst2gemtext.parse_rst("* bar"), output)
+        assert writer.visitor is visitor
+        assert writer.output == "* bar\n"
+
+
+class Test_NodeGroup:
+    @pytest.mark.parametrize(
+        "node_group_class",
+        [rst2gemtext.LinkGroupNode, rst2gemtext.BlockQuoteNode],
+    )
+    def test_write_gemtext(self, node_group_class):
+        node_group = node_group_class(None)
+        node_group.nodes = [
+            rst2gemtext.LinkNode(None, uri="gemini://foo"),
+            rst2gemtext.LinkNode(None, uri="gemini://bar", text="Bar"),
+        ]
+        output = io.StringIO()
+        node_group.write_gemtext(output)
+        assert output.getvalue() == node_group.to_gemtext()
+
+
+class Test_TitleNode:
+    @pytest.mark.parametrize(
+        "level,result",
+        [
+            (0, "# Title"),
+            (1, "# Title"),
+            (2, "## Title"),
+            (3, "### Title"),
+            (4, "### Title"),
+        ],
+    )
+    def test_to_gemtext(self, level, result):
+        node = rst2gemtext.TitleNode(None, level=level)
+        node.rawtext = "Title"
+        assert node.to_gemtext() == result
+
 
 class Test_EnumaratedListNode:
     @pytest.mark.parametrize(
@@ -59,3 +373,22 @@ class Test_EnumaratedListNode:
     def test_to_loweralpha(self, number, result):
         node = rst2gemtext.EnumaratedListNode(None)
         assert node._to_loweralpha(number) == result
+
+    def test_enumtype_changed_after_init(self):
+        node = rst2gemtext.EnumaratedListNode(None)
+        item = rst2gemtext.ListItemNode(None)
+        item.rawtext = "x"
+        node.nodes = [item]
+        node.enumtype = "upperroman"
+        assert node.to_gemtext() == "* I. x"
+
+    def test_convertor_overridden_by_subclass(self):
+        class EnumaratedListNode(rst2gemtext.EnumaratedListNode):
+            def _to_arabic(self, number):
+                return "#%i" % number
+
+        node = EnumaratedListNode(None)
+        item = rst2gemtext.ListItemNode(None)
+        item.rawtext = "x"
+        node.nodes = [item]
+        assert node.to_gemtext() == "* #1. x"